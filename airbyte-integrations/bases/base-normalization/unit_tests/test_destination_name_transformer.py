@@ -23,8 +23,6 @@
 #
 
 
-import os
-
 import pytest
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog.destination_name_transformer import (
@@ -34,18 +32,6 @@ from normalization.transform_catalog.destination_name_transformer import (
 )
 
 
-@pytest.fixture(scope="function", autouse=True)
-def before_tests(request):
-    # This makes the test run whether it is executed from the tests folder (with pytest/gradle) or from the base-normalization folder (through pycharm)
-    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
-    if os.path.exists(unit_tests_dir):
-        os.chdir(unit_tests_dir)
-    else:
-        os.chdir(request.fspath.dirname)
-    yield
-    os.chdir(request.config.invocation_dir)
-
-
 @pytest.mark.parametrize(
     "input_str, destination_type, expected",
     [
@@ -23,44 +23,71 @@
 #
 
 
-import json
 import os
+from collections import namedtuple
+from functools import lru_cache
 
 import pytest
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog.catalog_processor import CatalogProcessor, add_table_to_registry
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
 
+CATALOG_FILES = ["edge_cases_catalog", "nested_catalog"]
+INTEGRATION_TYPES = ["Postgres", "BigQuery", "Snowflake", "Redshift"]
+
+ResourceFiles = namedtuple("ResourceFiles", ["catalog", "top_level", "top_level_specialized", "nested", "nested_specialized"])
 
-@pytest.fixture(scope="function", autouse=True)
-def before_tests(request):
+# Resource file names used by each catalog_file/integration_type combination, computed once at import
+RESOURCE_FILES = {
+    (catalog_file, integration_type): ResourceFiles(
+        catalog=f"{catalog_file}.json",
+        top_level=f"{catalog_file}_expected_top_level.json",
+        top_level_specialized=f"{catalog_file}_expected_top_level_{integration_type.lower()}.json",
+        nested=f"{catalog_file}_expected_nested.json",
+        nested_specialized=f"{catalog_file}_expected_nested_{integration_type.lower()}.json",
+    )
+    for catalog_file in CATALOG_FILES
+    for integration_type in INTEGRATION_TYPES
+}
+
+
+@pytest.fixture(scope="session")
+def resources_dir():
     # This makes the test run whether it is executed from the tests folder (with pytest/gradle) or from the base-normalization folder (through pycharm)
-    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
-    if os.path.exists(unit_tests_dir):
-        os.chdir(unit_tests_dir)
-    else:
-        os.chdir(request.fspath.dirname)
-    yield
-    os.chdir(request.config.invocation_dir)
+    # without changing the (process-wide) working directory, so tests can be distributed with pytest-xdist
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+
+
+@pytest.fixture(scope="session")
+def resources_files(resources_dir):
+    # List resources only once instead of checking if specialized expected files exist in every test
+    return set(os.listdir(resources_dir))
+
+
+@pytest.fixture(scope="session")
+def name_transformers():
+    return {destination_type: DestinationNameTransformer(destination_type) for destination_type in DestinationType}
 
 
 @pytest.mark.parametrize(
     "catalog_file",
-    [
-        "edge_cases_catalog",
-        "nested_catalog",
-    ],
+    # group tests by catalog file on the same worker when running with `pytest -n auto --dist loadgroup`
+    [pytest.param(catalog_file, marks=pytest.mark.xdist_group(name=catalog_file)) for catalog_file in CATALOG_FILES],
 )
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        "Postgres",
-        "BigQuery",
-        "Snowflake",
-        "Redshift",
-    ],
-)
-def test_stream_processor_tables_naming(integration_type: str, catalog_file: str):
+@pytest.mark.parametrize("integration_type", INTEGRATION_TYPES)
+def test_stream_processor_tables_naming(
+    integration_type: str,
+    catalog_file: str,
+    resources_dir: str,
+    resources_files: set,
+    name_transformers: dict,
+):
     """
     For a given catalog.json and destination, multiple cases can occur where naming becomes tricky.
     (especially since some destination like postgres have a very low limit to identifiers length of 64 characters)
@@ -87,17 +114,18 @@ def test_stream_processor_tables_naming(integration_type: str, catalog_file: str
     (mapping per schema to all tables in that schema, mapping to the final filename)
     """
     destination_type = DestinationType.from_string(integration_type)
+    files = RESOURCE_FILES[(catalog_file, integration_type)]
     tables_registry = {}
 
     substreams = []
-    catalog = read_json(f"resources/{catalog_file}.json")
+    catalog = read_json(os.path.join(resources_dir, files.catalog))
 
     # process top level
     for stream_processor in CatalogProcessor.build_stream_processor(
         catalog=catalog,
         json_column_name="'json_column_name_test'",
         default_schema="schema_test",
-        name_transformer=DestinationNameTransformer(destination_type),
+        name_transformer=name_transformers[destination_type],
         destination_type=destination_type,
         tables_registry=tables_registry,
     ):
@@ -111,10 +139,8 @@ def test_stream_processor_tables_naming(integration_type: str, catalog_file: str
         apply_function = str.upper
     elif DestinationType.REDSHIFT.value == destination_type.value:
         apply_function = str.lower
-    if os.path.exists(f"resources/{catalog_file}_expected_top_level_{integration_type.lower()}.json"):
-        expected_top_level = read_json(f"resources/{catalog_file}_expected_top_level_{integration_type.lower()}.json", apply_function)
-    else:
-        expected_top_level = read_json(f"resources/{catalog_file}_expected_top_level.json", apply_function)
+    expected_file = files.top_level_specialized if files.top_level_specialized in resources_files else files.top_level
+    expected_top_level = read_json(os.path.join(resources_dir, expected_file), apply_function)
 
     assert tables_registry == expected_top_level
 
@@ -129,15 +155,8 @@ def test_stream_processor_tables_naming(integration_type: str, catalog_file: str
             if nested_processors:
                 substreams += nested_processors
 
-    apply_function = None
-    if DestinationType.SNOWFLAKE.value == destination_type.value:
-        apply_function = str.upper
-    elif DestinationType.REDSHIFT.value == destination_type.value:
-        apply_function = str.lower
-    if os.path.exists(f"resources/{catalog_file}_expected_nested_{integration_type.lower()}.json"):
-        expected_nested = read_json(f"resources/{catalog_file}_expected_nested_{integration_type.lower()}.json", apply_function)
-    else:
-        expected_nested = read_json(f"resources/{catalog_file}_expected_nested.json", apply_function)
+    expected_file = files.nested_specialized if files.nested_specialized in resources_files else files.nested
+    expected_nested = read_json(os.path.join(resources_dir, expected_file), apply_function)
 
     # remove expected top level tables from tables_registry
     for schema in expected_top_level:
@@ -149,8 +168,30 @@ def test_stream_processor_tables_naming(integration_type: str, catalog_file: str
 
 
 def read_json(input_path: str, apply_function=None):
-    with open(input_path, "r") as file:
-        contents = file.read()
+    data = json_loads(load_file(input_path))
     if apply_function:
-        contents = apply_function(contents)
-    return json.loads(contents)
+        data = apply_to_strings(data, apply_function)
+    return data
+
+
+def apply_to_strings(data, apply_function):
+    """
+    Apply a function on all keys and string values of a parsed json structure (instead of on the raw json text)
+    """
+    if isinstance(data, dict):
+        return {apply_to_strings(key, apply_function): apply_to_strings(value, apply_function) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [apply_to_strings(value, apply_function) for value in data]
+    elif isinstance(data, str):
+        return apply_function(data)
+    return data
+
+
+@lru_cache(maxsize=None)
+def load_file(input_path: str) -> bytes:
+    """
+    Read the raw content of a resource file only once: the same files are re-used by every parametrized destination type.
+    (parsing is always re-applied by callers so they are free to mutate the returned objects)
+    """
+    with open(input_path, "rb") as file:
+        return file.read()
@@ -23,7 +23,6 @@
 #
 
 
-import os
 from typing import List
 
 import pytest
@@ -33,16 +32,9 @@ from normalization.transform_catalog.destination_name_transformer import Destina
 from normalization.transform_catalog.stream_processor import StreamProcessor, get_table_name
 
 
-@pytest.fixture(scope="function", autouse=True)
-def before_tests(request):
-    # This makes the test run whether it is executed from the tests folder (with pytest/gradle) or from the base-normalization folder (through pycharm)
-    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
-    if os.path.exists(unit_tests_dir):
-        os.chdir(unit_tests_dir)
-    else:
-        os.chdir(request.fspath.dirname)
-    yield
-    os.chdir(request.config.invocation_dir)
+@pytest.fixture(scope="session")
+def postgres_name_transformer():
+    return DestinationNameTransformer(DestinationType.POSTGRES)
 
 
 @pytest.mark.parametrize(
@@ -66,7 +58,13 @@ def before_tests(request):
         ("", "abcdefghijklmnopqrstuvwxyzabcdefghijklmnopqrstuvwxyz", "", "abcdefghijklmnopqrst__fghijklmnopqrstuvwxyz"),
     ],
 )
-def test_get_table_name(root_table: str, base_table_name: str, suffix: str, expected: str):
+def test_get_table_name(
+    postgres_name_transformer: DestinationNameTransformer,
+    root_table: str,
+    base_table_name: str,
+    suffix: str,
+    expected: str,
+):
     """
     - parent table: referred to as root table
     - child table: referred to as base table.
@@ -80,8 +78,7 @@ def test_get_table_name(root_table: str, base_table_name: str, suffix: str, expe
     A set of complicated rules are done in order to choose what parts to truncate or what to leave and handle
     name collisions.
     """
-    name_transformer = DestinationNameTransformer(DestinationType.POSTGRES)
-    name = get_table_name(name_transformer, root_table, base_table_name, suffix, ["json", "path"])
+    name = get_table_name(postgres_name_transformer, root_table, base_table_name, suffix, ["json", "path"])
     assert name == expected
     assert len(name) <= 43  # explicitly check for our max postgres length in case tests are changed in the future
 